@@ -411,6 +411,19 @@ namespace MCPForUnity.Editor
                             0,
                             bytesRead
                         );
+
+                        // Reject obviously invalid frames on the socket thread so
+                        // they never pay the queue lock + editor-update round trip.
+                        if (string.IsNullOrWhiteSpace(commandText))
+                        {
+                            byte[] emptyResponseBytes = System.Text.Encoding.UTF8.GetBytes(
+                                /*lang=json,strict*/
+                                "{\"status\":\"error\",\"error\":\"Empty command received\"}"
+                            );
+                            await stream.WriteAsync(emptyResponseBytes, 0, emptyResponseBytes.Length);
+                            continue;
+                        }
+
                         string commandId = Guid.NewGuid().ToString();
                         TaskCompletionSource<string> tcs = new();
 
@@ -446,117 +459,116 @@ namespace MCPForUnity.Editor
 
         private static void ProcessCommands()
         {
-            List<string> processedIds = new();
+            // Periodic heartbeat while editor is idle/processing (main-thread state only)
+            double now = EditorApplication.timeSinceStartup;
+            if (now >= nextHeartbeatAt)
+            {
+                WriteHeartbeat(false);
+                nextHeartbeatAt = now + 0.5f;
+            }
+
+            // Drain pending commands under the lock, then execute outside it so
+            // socket threads enqueueing new commands are never blocked behind a
+            // long-running handler. Skip the snapshot allocation entirely when idle.
+            List<KeyValuePair<string, (string commandJson, TaskCompletionSource<string> tcs)>> pending;
             lock (lockObj)
             {
-                // Periodic heartbeat while editor is idle/processing
-                double now = EditorApplication.timeSinceStartup;
-                if (now >= nextHeartbeatAt)
+                if (commandQueue.Count == 0)
                 {
-                    WriteHeartbeat(false);
-                    nextHeartbeatAt = now + 0.5f;
+                    return;
                 }
+                pending = commandQueue.ToList();
+                commandQueue.Clear();
+            }
 
-                foreach (
-                    KeyValuePair<
-                        string,
-                        (string commandJson, TaskCompletionSource<string> tcs)
-                    > kvp in commandQueue.ToList()
-                )
-                {
-                    string id = kvp.Key;
-                    string commandText = kvp.Value.commandJson;
-                    TaskCompletionSource<string> tcs = kvp.Value.tcs;
+            foreach (
+                KeyValuePair<
+                    string,
+                    (string commandJson, TaskCompletionSource<string> tcs)
+                > kvp in pending
+            )
+            {
+                string commandText = kvp.Value.commandJson;
+                TaskCompletionSource<string> tcs = kvp.Value.tcs;
 
-                    try
+                try
+                {
+                    // Special case handling
+                    if (string.IsNullOrEmpty(commandText))
                     {
-                        // Special case handling
-                        if (string.IsNullOrEmpty(commandText))
+                        var emptyResponse = new
                         {
-                            var emptyResponse = new
-                            {
-                                status = "error",
-                                error = "Empty command received",
-                            };
-                            tcs.SetResult(JsonConvert.SerializeObject(emptyResponse));
-                            processedIds.Add(id);
-                            continue;
-                        }
+                            status = "error",
+                            error = "Empty command received",
+                        };
+                        tcs.SetResult(JsonConvert.SerializeObject(emptyResponse));
+                        continue;
+                    }
 
-                        // Trim the command text to remove any whitespace
-                        commandText = commandText.Trim();
+                    // Trim the command text to remove any whitespace
+                    commandText = commandText.Trim();
 
-                        // Non-JSON direct commands handling (like ping)
-                        if (commandText == "ping")
+                    // Non-JSON direct commands handling (like ping)
+                    if (commandText == "ping")
+                    {
+                        var pingResponse = new
                         {
-                            var pingResponse = new
-                            {
-                                status = "success",
-                                result = new { message = "pong" },
-                            };
-                            tcs.SetResult(JsonConvert.SerializeObject(pingResponse));
-                            processedIds.Add(id);
-                            continue;
-                        }
+                            status = "success",
+                            result = new { message = "pong" },
+                        };
+                        tcs.SetResult(JsonConvert.SerializeObject(pingResponse));
+                        continue;
+                    }
 
-                        // Check if the command is valid JSON before attempting to deserialize
-                        if (!IsValidJson(commandText))
+                    // Check if the command is valid JSON before attempting to deserialize
+                    if (!IsValidJson(commandText))
+                    {
+                        var invalidJsonResponse = new
                         {
-                            var invalidJsonResponse = new
-                            {
-                                status = "error",
-                                error = "Invalid JSON format",
-                                receivedText = commandText.Length > 50
-                                    ? commandText[..50] + "..."
-                                    : commandText,
-                            };
-                            tcs.SetResult(JsonConvert.SerializeObject(invalidJsonResponse));
-                            processedIds.Add(id);
-                            continue;
-                        }
+                            status = "error",
+                            error = "Invalid JSON format",
+                            receivedText = commandText.Length > 50
+                                ? commandText[..50] + "..."
+                                : commandText,
+                        };
+                        tcs.SetResult(JsonConvert.SerializeObject(invalidJsonResponse));
+                        continue;
+                    }
 
-                        // Normal JSON command processing
-                        Command command = JsonConvert.DeserializeObject<Command>(commandText);
+                    // Normal JSON command processing
+                    Command command = JsonConvert.DeserializeObject<Command>(commandText);
                         
-                        if (command == null)
-                        {
-                            var nullCommandResponse = new
-                            {
-                                status = "error",
-                                error = "Command deserialized to null",
-                                details = "The command was valid JSON but could not be deserialized to a Command object",
-                            };
-                            tcs.SetResult(JsonConvert.SerializeObject(nullCommandResponse));
-                        }
-                        else
-                        {
-                            string responseJson = ExecuteCommand(command);
-                            tcs.SetResult(responseJson);
-                        }
-                    }
-                    catch (Exception ex)
+                    if (command == null)
                     {
-                        Debug.LogError($"Error processing command: {ex.Message}\n{ex.StackTrace}");
-
-                        var response = new
+                        var nullCommandResponse = new
                         {
                             status = "error",
-                            error = ex.Message,
-                            commandType = "Unknown (error during processing)",
-                            receivedText = commandText?.Length > 50
-                                ? commandText[..50] + "..."
-                                : commandText,
+                            error = "Command deserialized to null",
+                            details = "The command was valid JSON but could not be deserialized to a Command object",
                         };
-                        string responseJson = JsonConvert.SerializeObject(response);
+                        tcs.SetResult(JsonConvert.SerializeObject(nullCommandResponse));
+                    }
+                    else
+                    {
+                        string responseJson = ExecuteCommand(command);
                         tcs.SetResult(responseJson);
                     }
-
-                    processedIds.Add(id);
                 }
-
-                foreach (string id in processedIds)
+                catch (Exception ex)
                 {
-                    commandQueue.Remove(id);
+                    Debug.LogError($"Error processing command: {ex.Message}\n{ex.StackTrace}");
+
+                    var response = new
+                    {
+                        status = "error",
+                        error = ex.Message,
+                        commandType = "Unknown (error during processing)",
+                        receivedText = commandText?.Length > 50
+                            ? commandText[..50] + "..."
+                            : commandText,
+                    };
+                    string responseJson = JsonConvert.SerializeObject(response);
+                    tcs.SetResult(responseJson);
                 }
             }
         }
@@ -619,23 +631,13 @@ namespace MCPForUnity.Editor
                 // Use JObject for parameters as the new handlers likely expect this
                 JObject paramsObject = command.@params ?? new JObject();
 
-                // Route command based on the new tool structure from the refactor plan
-                object result = command.type switch
-                {
-                    // Maps the command type (tool name) to the corresponding handler's static HandleCommand method
-                    // Assumes each handler class has a static method named 'HandleCommand' that takes JObject parameters
-                    "manage_script" => ManageScript.HandleCommand(paramsObject),
-                    "manage_scene" => ManageScene.HandleCommand(paramsObject),
-                    "manage_editor" => ManageEditor.HandleCommand(paramsObject),
-                    "manage_gameobject" => ManageGameObject.HandleCommand(paramsObject),
-                    "manage_asset" => ManageAsset.HandleCommand(paramsObject),
-                    "manage_shader" => ManageShader.HandleCommand(paramsObject),
-                    "read_console" => ReadConsole.HandleCommand(paramsObject),
-                    "execute_menu_item" => ExecuteMenuItem.HandleCommand(paramsObject),
-                    _ => throw new ArgumentException(
+                // Route through the pre-built dispatch table in CommandRegistry so
+                // unknown command types are rejected with a single lookup.
+                Func<JObject, object> handler = CommandRegistry.GetHandler(command.type)
+                    ?? throw new ArgumentException(
                         $"Unknown or unsupported command type: {command.type}"
-                    ),
-                };
+                    );
+                object result = handler(paramsObject);
 
                 // Standard success response format
                 var response = new { status = "success", result };
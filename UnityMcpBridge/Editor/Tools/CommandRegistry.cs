@@ -9,10 +9,21 @@ namespace MCPForUnity.Editor.Tools
     /// </summary>
     public static class CommandRegistry
     {
-        // Maps command names (matching those called from Python via ctx.bridge.unity_editor.HandlerName)
-        // to the corresponding static HandleCommand method in the appropriate tool class.
+        // Maps command names to the corresponding static HandleCommand method in
+        // the appropriate tool class. Both key styles resolve: the wire-level
+        // command type (e.g. "manage_script") used by MCPForUnityBridge dispatch,
+        // and the legacy handler name (e.g. "HandleManageScript") called from
+        // Python via ctx.bridge.unity_editor.HandlerName.
         private static readonly Dictionary<string, Func<JObject, object>> _handlers = new()
         {
+            { "manage_script", ManageScript.HandleCommand },
+            { "manage_scene", ManageScene.HandleCommand },
+            { "manage_editor", ManageEditor.HandleCommand },
+            { "manage_gameobject", ManageGameObject.HandleCommand },
+            { "manage_asset", ManageAsset.HandleCommand },
+            { "read_console", ReadConsole.HandleCommand },
+            { "execute_menu_item", ExecuteMenuItem.HandleCommand },
+            { "manage_shader", ManageShader.HandleCommand },
             { "HandleManageScript", ManageScript.HandleCommand },
             { "HandleManageScene", ManageScene.HandleCommand },
             { "HandleManageEditor", ManageEditor.HandleCommand },
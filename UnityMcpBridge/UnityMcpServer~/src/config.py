@@ -5,7 +5,7 @@ This file contains all configurable parameters for the server.
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Main configuration class for the MCP server."""
     
@@ -104,7 +104,7 @@ class PortDiscovery:
         if status:
             port = status.get('unity_port')
             if isinstance(port, int) and PortDiscovery._try_probe_unity_mcp(port):
-                logger.info(f"Using Unity port from status: {port}")
+                logger.info("Using Unity port from status: %s", port)
                 return port
 
         candidates = PortDiscovery.list_candidate_files()
@@ -120,17 +120,17 @@ class PortDiscovery:
                     if first_seen_port is None:
                         first_seen_port = unity_port
                     if PortDiscovery._try_probe_unity_mcp(unity_port):
-                        logger.info(f"Using Unity port from {path.name}: {unity_port}")
+                        logger.info("Using Unity port from %s: %s", path.name, unity_port)
                         return unity_port
             except Exception as e:
-                logger.warning(f"Could not read port registry {path}: {e}")
+                logger.warning("Could not read port registry %s: %s", path, e)
 
         if first_seen_port is not None:
-            logger.info(f"No responsive port found; using first seen value {first_seen_port}")
+            logger.info("No responsive port found; using first seen value %s", first_seen_port)
             return first_seen_port
 
         # Fallback to default port
-        logger.info(f"No port registry found; using default port {PortDiscovery.DEFAULT_PORT}")
+        logger.info("No port registry found; using default port %s", PortDiscovery.DEFAULT_PORT)
         return PortDiscovery.DEFAULT_PORT
     
     @staticmethod
@@ -151,5 +151,5 @@ class PortDiscovery:
                 with open(path, 'r') as f:
                     return json.load(f)
             except Exception as e:
-                logger.warning(f"Could not read port configuration {path}: {e}")
+                logger.warning("Could not read port configuration %s: %s", path, e)
         return None
\ No newline at end of file
@@ -1,5 +1,7 @@
 from mcp.server.fastmcp import FastMCP, Context, Image
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Dict, Any, List
@@ -7,11 +9,20 @@ from config import config
 from tools import register_all_tools
 from unity_connection import get_unity_connection, UnityConnection
 
-# Configure logging using settings from config
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format=config.log_format
-)
+# Route records through a queue so formatting and stream I/O happen on a
+# dedicated listener thread; the request path only pays a queue put. Imported
+# modules may already have installed a direct handler via basicConfig, so
+# replace root handlers wholesale.
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter(config.log_format))
+_root_logger = logging.getLogger()
+for _h in _root_logger.handlers[:]:
+    _root_logger.removeHandler(_h)
+_root_logger.setLevel(getattr(logging, config.log_level))
+_root_logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_listener.start()
 logger = logging.getLogger("mcp-for-unity-server")
 
 # Global connection state
@@ -26,7 +37,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         _unity_connection = get_unity_connection()
         logger.info("Connected to Unity on startup")
     except Exception as e:
-        logger.warning(f"Could not connect to Unity on startup: {str(e)}")
+        logger.warning("Could not connect to Unity on startup: %s", e)
         _unity_connection = None
     try:
         # Yield the connection object so it can be attached to the context
@@ -37,6 +48,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
             _unity_connection.disconnect()
             _unity_connection = None
         logger.info("MCP for Unity Server shut down")
+        _log_listener.stop()
 
 # Initialize MCP server
 mcp = FastMCP(
@@ -50,23 +62,26 @@ register_all_tools(mcp)
 
 # Asset Creation Strategy
 
+# Folded once at import; the prompt handler just returns the constant.
+_ASSET_STRATEGY = (
+    "Available MCP for Unity Server Tools:\\n\\n"
+    "- `manage_editor`: Controls editor state and queries info.\\n"
+    "- `execute_menu_item`: Executes Unity Editor menu items by path.\\n"
+    "- `read_console`: Reads or clears Unity console messages, with filtering options.\\n"
+    "- `manage_scene`: Manages scenes.\\n"
+    "- `manage_gameobject`: Manages GameObjects in the scene.\\n"
+    "- `manage_script`: Manages C# script files.\\n"
+    "- `manage_asset`: Manages prefabs and assets.\\n"
+    "- `manage_shader`: Manages shaders.\\n\\n"
+    "Tips:\\n"
+    "- Create prefabs for reusable GameObjects.\\n"
+    "- Always include a camera and main light in your scenes.\\n"
+)
+
 @mcp.prompt()
 def asset_creation_strategy() -> str:
     """Guide for discovering and using MCP for Unity tools effectively."""
-    return (
-        "Available MCP for Unity Server Tools:\\n\\n"
-        "- `manage_editor`: Controls editor state and queries info.\\n"
-        "- `execute_menu_item`: Executes Unity Editor menu items by path.\\n"
-        "- `read_console`: Reads or clears Unity console messages, with filtering options.\\n"
-        "- `manage_scene`: Manages scenes.\\n"
-        "- `manage_gameobject`: Manages GameObjects in the scene.\\n"
-        "- `manage_script`: Manages C# script files.\\n"
-        "- `manage_asset`: Manages prefabs and assets.\\n"
-        "- `manage_shader`: Manages shaders.\\n\\n"
-        "Tips:\\n"
-        "- Create prefabs for reusable GameObjects.\\n"
-        "- Always include a camera and main light in your scenes.\\n"
-    )
+    return _ASSET_STRATEGY
 
 # Run the server
 if __name__ == "__main__":
@@ -1,16 +1,26 @@
+import asyncio
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any
-from unity_connection import get_unity_connection, send_command_with_retry
+from unity_connection import get_unity_connection, async_send_command_with_retry
+from .resource_tools import invalidate_resource_listing
+from .manage_script_edits import invalidate_script_read_cache
 from config import config
 import time
 import os
-import base64
+import binascii
+
+# Payloads above this size get encoded off the event loop.
+_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+def _encode_contents(contents: str) -> str:
+    return binascii.b2a_base64(contents.encode('utf-8'), newline=False).decode('ascii')
 
 def register_manage_script_tools(mcp: FastMCP):
     """Register all script management tools with the MCP server."""
 
     @mcp.tool()
-    def manage_script(
+    async def manage_script(
         ctx: Context,
         action: str,
         name: str,
@@ -34,35 +44,48 @@ def register_manage_script_tools(mcp: FastMCP):
             Dictionary with results ('success', 'message', 'data').
         """
         try:
-            # Prepare parameters for Unity
+            # Prepare parameters for Unity: required keys up front, optional
+            # ones inserted only when present - no build-then-filter rebuild.
             params = {
                 "action": action,
                 "name": name,
                 "path": path,
-                "namespace": namespace,
-                "scriptType": script_type
             }
-            
+            if namespace is not None:
+                params["namespace"] = namespace
+            if script_type is not None:
+                params["scriptType"] = script_type
+
             # Base64 encode the contents if they exist to avoid JSON escaping issues
             if contents is not None:
                 if action in ['create', 'update']:
-                    # Encode content for safer transmission
-                    params["encodedContents"] = base64.b64encode(contents.encode('utf-8')).decode('utf-8')
+                    # Encode content for safer transmission; large scripts go
+                    # to a worker thread so the MCP loop keeps serving.
+                    if len(contents) > _OFFLOAD_THRESHOLD:
+                        params["encodedContents"] = await asyncio.to_thread(_encode_contents, contents)
+                    else:
+                        params["encodedContents"] = _encode_contents(contents)
                     params["contentsEncoded"] = True
                 else:
                     params["contents"] = contents
             
-            # Remove None values so they don't get sent as null
-            params = {k: v for k, v in params.items() if v is not None}
-
-            # Send command via centralized retry helper
-            response = send_command_with_retry("manage_script", params)
+            # Send command via centralized async retry helper
+            response = await async_send_command_with_retry("manage_script", params)
             
             # Process response from Unity
             if isinstance(response, dict) and response.get("success"):
-                # If the response contains base64 encoded content, decode it
-                if response.get("data", {}).get("contentsEncoded"):
-                    decoded_contents = base64.b64decode(response["data"]["encodedContents"]).decode('utf-8')
+                # Keep the resources listing honest when the script set changes
+                if action in ('create', 'delete'):
+                    invalidate_resource_listing()
+                # Any write outside script_apply_edits invalidates its
+                # trust-on-write contents cache
+                if action in ('create', 'update', 'delete'):
+                    invalidate_script_read_cache()
+                # Decode the echoed contents only when the caller asked to
+                # read; create/update echoes would just burn a full-size
+                # decode for an ack the client ignores.
+                if action == 'read' and response.get("data", {}).get("contentsEncoded"):
+                    decoded_contents = binascii.a2b_base64(response["data"]["encodedContents"]).decode('utf-8')
                     response["data"]["contents"] = decoded_contents
                     del response["data"]["encodedContents"]
                     del response["data"]["contentsEncoded"]
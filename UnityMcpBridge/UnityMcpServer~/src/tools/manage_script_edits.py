@@ -0,0 +1,648 @@
+"""
+Defines the script_apply_edits tool for applying batched edits to C# scripts.
+
+Text-level ops (prepend, append, anchor_insert, replace_range, regex_replace)
+are applied locally against the script contents fetched from Unity, then
+written back in one update. Class/method-level structured ops are recognized
+only to be rejected with a clear error: this bridge's manage_script handler
+speaks create/read/update/delete, nothing syntax-aware.
+"""
+import asyncio
+import binascii
+import bisect
+import difflib
+import hashlib
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+
+try:  # renamed to re._parser/_constants in 3.11; old names still importable
+    from re import _constants as _sre_constants, _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
+from typing import Dict, Any, List
+from mcp.server.fastmcp import FastMCP, Context
+from unity_connection import async_send_command_with_retry
+from config import config
+
+# Payloads above this size get encoded/hashed off the event loop.
+_OFFLOAD_THRESHOLD = 64 * 1024
+
+# Trust-on-write read cache: agent loops hit the same script back-to-back,
+# and after a successful update we know exactly what the editor holds.
+# Opt-in per request (options.allow_cached_read) because writes made outside
+# this tool invalidate our copy without telling us; a precondition that does
+# not match the cached sha always falls through to a real read.
+_SCRIPT_CACHE_MAX = 32
+_script_read_cache: "OrderedDict[tuple[str, str], tuple[str, str]]" = OrderedDict()
+
+
+def invalidate_script_read_cache():
+    """Drop cached script contents; call after out-of-band script writes."""
+    _script_read_cache.clear()
+
+
+# Preview diffs are for eyeballing, not transport; stop generating past this.
+_DIFF_MAX_LINES = 2000
+
+# Class/method-level ops we recognize so they fail with a clear error:
+# this bridge's manage_script handler has no syntax-aware editing.
+_STRUCTURED_OPS = frozenset({"replace_class", "delete_class", "replace_method", "delete_method", "insert_method"})
+
+# Canonical field spellings, applied in one pass per edit so the handlers
+# and the editor both see a single schema. Destination wins on conflict.
+_MISSING = object()
+_ALIASES = (
+    ("operation", "op"),
+    ("kind", "op"),
+    ("type", "op"),
+    ("class_name", "className"),
+    ("class", "className"),
+    ("method_name", "methodName"),
+    ("method", "methodName"),
+    ("start_line", "startLine"),
+    ("end_line", "endLine"),
+    ("content", "text"),
+    ("contents", "text"),
+)
+
+
+def _unwrap_and_alias(e: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the edit with canonical field names and a lowered op."""
+    ne = dict(e)
+    for src, dst in _ALIASES:
+        v = ne.pop(src, _MISSING)
+        if v is not _MISSING and dst not in ne:
+            ne[dst] = v
+    ne["op"] = str(ne.get("op") or "").strip().lower()
+    return ne
+
+
+def _normalize_edits(edits: List[Dict[str, Any]]):
+    """Yield canonicalized copies of each edit, one at a time.
+
+    A generator so the consuming scan fuses normalization with routing in
+    a single pass, with no second iteration over the batch.
+    """
+    for e in edits:
+        yield _unwrap_and_alias(e)
+
+
+_UNITY_PREFIX = "unity://path/"
+_UNITY_PREFIX_LEN = len(_UNITY_PREFIX)
+_FILE_PREFIX = "file://"
+_FILE_PREFIX_LEN = len(_FILE_PREFIX)
+
+
+def _strip_scheme(s: str) -> str:
+    if s.startswith(_UNITY_PREFIX):
+        return s[_UNITY_PREFIX_LEN:]
+    if s.startswith(_FILE_PREFIX):
+        return s[_FILE_PREFIX_LEN:]
+    return s
+
+
+def _collapse_duplicate_tail(s: str) -> str:
+    """Drop a duplicated final segment (Assets/Scripts/Scripts) in place.
+
+    Two rfind scans and slice compares - no split/join list churn for the
+    overwhelmingly common no-duplicate case.
+    """
+    i = s.rfind("/")
+    if i <= 0:
+        return s
+    j = s.rfind("/", 0, i)
+    if s[j + 1:i] == s[i + 1:]:
+        return s[:i]
+    return s
+
+
+@lru_cache(maxsize=1024)
+def _normalize_script_locator(name: str, path: str) -> tuple[str, str]:
+    """Canonicalize a script locator to (bare name, project-relative folder).
+
+    Accepts unity://path/ or file:// URIs in either argument, names that
+    carry their own folder or .cs suffix, backslash separators, and folders
+    that accidentally duplicate their tail segment. An empty (or bare
+    "Assets") folder normalizes to "" so the editor applies its own default;
+    the editor strips only the "Assets/" prefix, so sending "Assets" itself
+    would resolve under Assets/Assets. Results depend only on the inputs,
+    so the cache needs no invalidation.
+    """
+    raw = _strip_scheme((name or "").strip()).replace("\\", "/")
+    folder = _strip_scheme((path or "").strip()).replace("\\", "/").rstrip("/")
+    if "/" in raw:
+        head, _, raw = raw.rpartition("/")
+        if not folder:
+            folder = head
+    if raw.endswith(".cs"):
+        raw = raw[:-3]
+    folder = _collapse_duplicate_tail(folder)
+    if folder == "Assets":
+        folder = ""
+    return raw, folder
+
+
+# Natural-language request pattern, compiled once at import. Only the
+# comment verb is supported: method-level rewrites would need the editor's
+# structured tooling, which this bridge does not expose.
+_RE_INSERT_COMMENT = re.compile(
+    r"(?:insert|add)\s+comment\s+[\"'](.+?)[\"']\s+(above|before|below|after)\s+(?:the\s+)?(?:method\s+)?([A-Za-z_][A-Za-z0-9_]*)",
+    re.IGNORECASE,
+)
+
+
+def _parse_natural_request_impl(request: str, script_name: str) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Uncached body of _parse_natural_request_to_edits."""
+    req = (request or "").strip()
+    edits: List[Dict[str, Any]] = []
+    context: Dict[str, Any] = {}
+    if not req:
+        return edits, context
+    # Cheap gate ahead of the pattern: every supported request names a comment.
+    if "comment" not in req.lower():
+        return edits, context
+    m = _RE_INSERT_COMMENT.search(req)
+    if m:
+        comment, where, method = m.group(1), m.group(2).lower(), m.group(3)
+        position = "before" if where in ("above", "before") else "after"
+        # Match the whole signature line (including its newline) so an
+        # "after" insert lands on the following line instead of splitting
+        # the signature at the opening parenthesis.
+        edits.append({
+            "op": "anchor_insert",
+            "anchor": rf"^.*\b{re.escape(method)}\s*\(.*(?:\n|$)",
+            "position": position,
+            "text": f"// {comment}",
+        })
+        context["method"] = method
+    return edits, context
+
+
+@lru_cache(maxsize=128)
+def _parse_natural_request_cached(request: str, script_name: str):
+    """Frozen-parse cache: agents retry identical requests verbatim, and the
+    translation is a pure function of (request, script_name)."""
+    edits, context = _parse_natural_request_impl(request, script_name)
+    return tuple(tuple(e.items()) for e in edits), tuple(context.items())
+
+
+def _parse_natural_request_to_edits(request: str, script_name: str) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Translate a small closed set of natural-language requests into edits.
+
+    Returns (edits, context); context carries the target method name when one
+    is known so callers can surface a verification slice. An empty edit list
+    means the request was not understood. Results are memoized; callers get
+    fresh mutable copies.
+    """
+    frozen_edits, frozen_context = _parse_natural_request_cached(request or "", script_name or "")
+    return [dict(t) for t in frozen_edits], dict(frozen_context)
+
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal(pattern: str) -> bool:
+    """True when the pattern contains no regex metacharacters."""
+    return not any(c in _REGEX_METACHARS for c in pattern)
+
+
+@lru_cache(maxsize=512)
+def _literal_prefix(pattern: str) -> str:
+    """Longest leading literal run of a pattern, or '' when none is provable.
+
+    Used as a prematcher: when the literal is absent from the text, the
+    regex engine never needs to run for that edit.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return ""
+    # Inline flags like (?i) make the recorded literal run case-sensitive
+    # while the match is not; no prefix is provable for such patterns.
+    if parsed.state.flags & re.IGNORECASE:
+        return ""
+    chars = []
+    for op, arg in parsed:
+        if op is _sre_constants.LITERAL:
+            chars.append(chr(arg))
+        else:
+            break
+    return "".join(chars)
+
+
+@lru_cache(maxsize=256)
+def _method_sig_re(method: str) -> "re.Pattern":
+    """Signature-line pattern for a method name; iterative refactors hit the
+    same method repeatedly, so cache per name."""
+    return re.compile(rf"(?m)^.*\b{re.escape(method)}\s*\(")
+
+
+@lru_cache(maxsize=512)
+def _compiled(pattern: str, flags: int = re.MULTILINE) -> "re.Pattern":
+    """Compile once per distinct (pattern, flags), shared across requests.
+
+    Editor loops reuse the same anchors call after call, so a module-level
+    cache beats both a per-batch dict and the re module's small internal one.
+    """
+    return re.compile(pattern, flags)
+
+
+def _extract_op(edit: Dict[str, Any]) -> str:
+    """Return the edit's canonical op name.
+
+    Edits that passed through _unwrap_and_alias already carry the lowered
+    op under "op"; the fallback keeps direct _apply_edits_locally callers
+    with alias spellings working.
+    """
+    return edit.get("op") or str(edit.get("type") or edit.get("kind") or "").strip().lower()
+
+
+def _edit_text(edit: Dict[str, Any]) -> str:
+    """Return the edit's payload text, normalized to end with a newline."""
+    insert = edit.get("text") or edit.get("content") or ""
+    if insert and not insert.endswith("\n"):
+        insert += "\n"
+    return insert
+
+
+class _EditEnv:
+    """Per-batch state shared by the op handlers.
+
+    Holds the original text and the lazily built line-start table; compiled
+    patterns come from the module-level _compiled cache.
+    """
+    __slots__ = ("text", "ends_nl", "_line_starts")
+
+    def __init__(self, text: str):
+        self.text = text
+        # One O(1) slice check shared by append and line accounting; no
+        # repeated endswith scans as appends accumulate.
+        self.ends_nl = text[-1:] == "\n"
+        self._line_starts = None
+
+    def compiled(self, pattern: str):
+        try:
+            return _compiled(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid regex pattern {pattern!r}: {e}")
+
+    def line_starts(self) -> List[int]:
+        if self._line_starts is None:
+            # Offset table via str.find: one O(M) scan, no per-line string
+            # allocations the way splitlines(keepends=True) pays.
+            table = [0]
+            i = 0
+            while True:
+                j = self.text.find("\n", i)
+                if j < 0:
+                    break
+                table.append(j + 1)
+                i = j + 1
+            self._line_starts = table
+        return self._line_starts
+
+    def n_lines(self) -> int:
+        table = self.line_starts()
+        return len(table) - 1 if self.ends_nl else len(table)
+
+
+def _line_col_from_index(env: _EditEnv, idx: int) -> tuple[int, int]:
+    """1-based (line, column) for an absolute index, O(log M) via bisect."""
+    table = env.line_starts()
+    line = bisect.bisect_right(table, idx)
+    return line, idx - table[line - 1] + 1
+
+
+def _op_prepend(env: _EditEnv, edit: Dict[str, Any]):
+    return [(0, 0, _edit_text(edit))]
+
+
+def _op_append(env: _EditEnv, edit: Dict[str, Any]):
+    insert = edit.get("text") or edit.get("content") or ""
+    if env.text and not env.ends_nl:
+        insert = "\n" + insert
+    return [(len(env.text), len(env.text), insert)]
+
+
+def _op_anchor_insert(env: _EditEnv, edit: Dict[str, Any]):
+    anchor = edit.get("anchor") or ""
+    if not anchor:
+        raise ValueError("anchor_insert requires an 'anchor' pattern")
+    position = str(edit.get("position") or "after").strip().lower()
+    if _is_literal(anchor):
+        # Plain literal anchors (whole signatures pasted verbatim) resolve
+        # with one C-level substring search; no regex machinery involved.
+        i = env.text.find(anchor)
+        if i < 0:
+            raise ValueError(f"anchor_insert: anchor not found: {anchor!r}")
+        idx = i + len(anchor) if position == "after" else i
+        return [(idx, idx, _edit_text(edit))]
+    lit = _literal_prefix(anchor)
+    if lit and lit not in env.text:
+        raise ValueError(f"anchor_insert: anchor not found: {anchor!r}")
+    m = env.compiled(anchor).search(env.text)
+    if m is None:
+        raise ValueError(f"anchor_insert: anchor not found: {anchor!r}")
+    idx = m.end() if position == "after" else m.start()
+    return [(idx, idx, _edit_text(edit))]
+
+
+def _op_replace_range(env: _EditEnv, edit: Dict[str, Any]):
+    line_starts = env.line_starts()
+    n_lines = env.n_lines()
+    start_line = int(edit.get("startLine") or edit.get("start_line") or 1)
+    end_line = int(edit.get("endLine") or edit.get("end_line") or start_line)
+    if not (1 <= start_line <= end_line <= max(n_lines, 1)):
+        raise ValueError(f"replace_range: bad range {start_line}..{end_line} for {n_lines}-line file")
+    a = line_starts[start_line - 1]
+    b = line_starts[end_line] if end_line < len(line_starts) else len(env.text)
+    return [(a, b, _edit_text(edit))]
+
+
+def _op_regex_replace(env: _EditEnv, edit: Dict[str, Any]):
+    pattern = edit.get("pattern") or ""
+    if not pattern:
+        raise ValueError("regex_replace requires a 'pattern'")
+    repl = edit.get("replacement")
+    if repl is None:
+        repl = edit.get("text") or ""
+    count = int(edit.get("count") or 0)
+    spans = []
+    if _is_literal(pattern) and "\\" not in repl:
+        # Plain rename: a str.find loop beats the regex engine by a wide
+        # margin and the replacement needs no group expansion.
+        start = 0
+        plen = len(pattern)
+        while True:
+            i = env.text.find(pattern, start)
+            if i < 0:
+                break
+            spans.append((i, i + plen, repl))
+            if count and len(spans) >= count:
+                break
+            start = i + plen
+    else:
+        lit = _literal_prefix(pattern)
+        if lit and lit not in env.text:
+            raise ValueError(f"regex_replace: pattern matched nothing: {pattern!r}")
+        for m in env.compiled(pattern).finditer(env.text):
+            spans.append((m.start(), m.end(), m.expand(repl)))
+            if count and len(spans) >= count:
+                break
+    if not spans:
+        raise ValueError(f"regex_replace: pattern matched nothing: {pattern!r}")
+    return spans
+
+
+# op name -> span resolver, built once at import; the apply loop is a single
+# dict lookup per edit instead of a string-comparison ladder.
+_OPS = {
+    "prepend": _op_prepend,
+    "append": _op_append,
+    "anchor_insert": _op_anchor_insert,
+    "replace_range": _op_replace_range,
+    "regex_replace": _op_regex_replace,
+}
+
+
+def _apply_edits_locally(text: str, edits: List[Dict[str, Any]]) -> tuple[str, List[str]]:
+    """Apply text-level edits as one batch, returning (new_text, applied op names).
+
+    Every edit is resolved to an absolute (start, end, replacement) span
+    against the ORIGINAL contents, then the result is rendered with a single
+    join - O(M + N log N) instead of rebuilding the string per edit. Spans
+    must not overlap.
+
+    Raises ValueError with a client-presentable message when an edit cannot
+    be applied (unknown op, missing anchor, bad range, overlap).
+    """
+    env = _EditEnv(text)
+    spans: List[tuple[int, int, str]] = []  # (start, end, replacement)
+    applied: List[str] = []
+    for edit in edits:
+        op = _extract_op(edit)
+        handler = _OPS.get(op)
+        if handler is None:
+            raise ValueError(f"Unknown edit op: {op!r}")
+        spans.extend(handler(env, edit))
+        applied.append(op)
+
+    # Render: sort spans, verify non-overlap, splice in one pass.
+    spans.sort(key=lambda s: (s[0], s[1]))
+    parts: List[str] = []
+    cursor = 0
+    for s, e, r in spans:
+        if s < cursor:
+            line, col = _line_col_from_index(env, s)
+            raise ValueError(f"Edits overlap at line {line}, column {col}; split them into separate calls.")
+        parts.append(text[cursor:s])
+        parts.append(r)
+        cursor = e
+    parts.append(text[cursor:])
+    return "".join(parts), applied
+
+
+def register_manage_script_edits_tools(mcp: FastMCP):
+    """Register the script_apply_edits tool with the MCP server."""
+
+    @mcp.tool()
+    async def script_apply_edits(
+        ctx: Context,
+        name: str,
+        path: str,
+        edits: List[Dict[str, Any]] = None,
+        options: Dict[str, Any] = None,
+        request: str = None,
+    ) -> Dict[str, Any]:
+        """Applies a batch of edits to a C# script in one round trip.
+
+        Args:
+            name: Script name (no .cs extension).
+            path: Asset folder; empty defers to the editor's default
+                ("Scripts").
+            edits: List of edit dicts. Text ops: 'prepend', 'append',
+                'anchor_insert' (anchor/position/text), 'replace_range'
+                (startLine/endLine/text), 'regex_replace' (pattern/replacement).
+                Class/method-level structured ops are not supported by this
+                bridge and are rejected with an explicit error.
+            options: Optional dict: 'precondition_sha256' guards against
+                concurrent modification; 'preview' includes a unified diff
+                in the response.
+            request: Optional natural-language request (e.g. 'insert comment
+                \"tune this\" above method Update') used when no explicit
+                edits are given.
+
+        Returns:
+            Dictionary with results ('success', 'message', 'data' incl. diff).
+        """
+        try:
+            # dict(options or {}) would copy a fresh empty dict for the
+            # common no-options call; branch instead.
+            options = dict(options) if options else {}
+            name, path = _normalize_script_locator(name, path)
+            context: Dict[str, Any] = {}
+            if not edits and request:
+                edits, context = _parse_natural_request_to_edits(request, name)
+                if not edits:
+                    return {"success": False, "message": f"Could not interpret request: {request!r}"}
+            if not edits:
+                return {"success": False, "message": "No edits provided."}
+
+            # Single pass: canonicalize fields and the op spelling, and
+            # collect any structured ops so the batch can be rejected before
+            # paying a round-trip - the bridge's manage_script handler only
+            # implements create/read/update/delete.
+            normalized_edits = []
+            unsupported = []
+            for ne in _normalize_edits(edits):
+                normalized_edits.append(ne)
+                if ne["op"] in _STRUCTURED_OPS:
+                    unsupported.append(ne["op"])
+            if unsupported:
+                return {
+                    "success": False,
+                    "message": "Structured ops are not supported by this bridge: "
+                               + ", ".join(sorted(set(unsupported)))
+                               + ". Use text ops (prepend, append, anchor_insert, replace_range, regex_replace).",
+                }
+
+            precondition = options.get("precondition_sha256")
+
+            cached = _script_read_cache.get((name, path))
+            if (
+                cached is not None
+                and options.get("allow_cached_read")
+                and (not precondition or precondition == cached[0])
+            ):
+                # Contents we wrote ourselves last round; the read round-trip
+                # (and any precondition hash) is already answered.
+                text = cached[1]
+            else:
+                # Fetch current contents from the editor.
+                read_resp = await async_send_command_with_retry("manage_script", {"action": "read", "name": name, "path": path})
+                if not (isinstance(read_resp, dict) and read_resp.get("success")):
+                    return read_resp if isinstance(read_resp, dict) else {"success": False, "message": str(read_resp)}
+                data = read_resp.get("data") or {}
+                if data.get("contentsEncoded"):
+                    # Keep the decoded bytes: the precondition hash can run over
+                    # them directly instead of re-encoding the str we just made.
+                    raw_bytes = binascii.a2b_base64(data.get("encodedContents") or "")
+                    text = raw_bytes.decode("utf-8")
+                else:
+                    text = data.get("contents") or ""
+                    raw_bytes = None
+
+                if precondition:
+                    buf = raw_bytes if raw_bytes is not None else text.encode("utf-8")
+                    actual = hashlib.sha256(buf, usedforsecurity=False).hexdigest()
+                    if actual != precondition:
+                        return {
+                            "success": False,
+                            "message": "Precondition sha256 mismatch; fetch the latest contents and retry.",
+                            "data": {"expected": precondition, "actual": actual},
+                        }
+            # Single pass: canonicalize fields and the op spelling, and
+            # collect any structured ops so the batch can be rejected before
+            # paying a round-trip - the bridge's manage_script handler only
+            # implements create/read/update/delete.
+            normalized_edits = []
+            unsupported = []
+            for ne in _normalize_edits(edits):
+                normalized_edits.append(ne)
+                if ne["op"] in _STRUCTURED_OPS:
+                    unsupported.append(ne["op"])
+            if unsupported:
+                return {
+                    "success": False,
+                    "message": "Structured ops are not supported by this bridge: "
+                               + ", ".join(sorted(set(unsupported)))
+                               + ". Use text ops (prepend, append, anchor_insert, replace_range, regex_replace).",
+                }
+
+            precondition = options.get("precondition_sha256")
+
+            new_text, applied = _apply_edits_locally(text, normalized_edits)
+
+            # The diff costs two splitlines passes plus the matcher; only
+            # pay for it when the client asked to see it.
+            diff = None
+            if options.get("preview") or options.get("show_diff"):
+                # unified_diff is a generator; islice caps the work as well
+                # as the output when the edit rewrites a huge file.
+                diff_lines = list(islice(difflib.unified_diff(
+                    text.splitlines(), new_text.splitlines(),
+                    fromfile=f"{name}.cs", tofile=f"{name}.cs", lineterm="",
+                ), _DIFF_MAX_LINES + 1))
+                if len(diff_lines) > _DIFF_MAX_LINES:
+                    diff_lines[_DIFF_MAX_LINES:] = ["... diff truncated ..."]
+                diff = "\n".join(diff_lines)
+
+            # Verification slice for natural-language method edits, taken
+            # from the text we are about to write - the post-apply read
+            # round-trip other implementations pay is unnecessary.
+            verification = None
+            method = context.get("method")
+            if method:
+                # One C-level search over the whole text, then walk newlines
+                # to bound a five-line window - no full line list, no
+                # per-line regex loop.
+                m = _method_sig_re(method).search(new_text)
+                if m is not None:
+                    a = m.start()
+                    for _ in range(3):
+                        a = new_text.rfind("\n", 0, a)
+                        if a < 0:
+                            break
+                    b = m.start()
+                    for _ in range(3):
+                        j = new_text.find("\n", b)
+                        if j < 0:
+                            b = len(new_text)
+                            break
+                        b = j + 1
+                    verification = new_text[a + 1: b].rstrip("\n")
+
+            def _encode_and_hash() -> tuple[str, str]:
+                raw = new_text.encode("utf-8")
+                return (
+                    binascii.b2a_base64(raw, newline=False).decode("ascii"),
+                    hashlib.sha256(raw).hexdigest(),
+                )
+
+            if len(new_text) > _OFFLOAD_THRESHOLD:
+                encoded, new_sha = await asyncio.to_thread(_encode_and_hash)
+            else:
+                encoded, new_sha = _encode_and_hash()
+
+            # Release the original contents before parking on the editor
+            # round-trip; new_text stays for the trust-on-write cache below.
+            del text
+
+            update_params = {
+                "action": "update",
+                "name": name,
+                "path": path,
+                "encodedContents": encoded,
+                "contentsEncoded": True,
+            }
+            write_resp = await async_send_command_with_retry("manage_script", update_params)
+            if isinstance(write_resp, dict) and write_resp.get("success"):
+                _script_read_cache[(name, path)] = (new_sha, new_text)
+                _script_read_cache.move_to_end((name, path))
+                while len(_script_read_cache) > _SCRIPT_CACHE_MAX:
+                    _script_read_cache.popitem(last=False)
+                data = {"applied": applied, "sha256": new_sha}
+                if diff is not None:
+                    data["diff"] = diff
+                if verification is not None:
+                    data["verification"] = verification
+                return {"success": True, "message": f"Applied {len(applied)} edit(s).", "data": data}
+            return write_resp if isinstance(write_resp, dict) else {"success": False, "message": str(write_resp)}
+
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        except Exception as e:
+            return {"success": False, "message": f"Python error applying edits: {str(e)}"}
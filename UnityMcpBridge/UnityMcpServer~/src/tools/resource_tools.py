@@ -0,0 +1,305 @@
+"""
+Defines resource tools for browsing and reading C# scripts in the Unity project.
+
+These operate directly on the project folder (located via UNITY_PROJECT_ROOT or
+the bridge heartbeat), so clients can list and fetch script sources without a
+round-trip through the editor.
+"""
+import os
+import hashlib
+import json
+import mmap
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any
+from mcp.server.fastmcp import FastMCP, Context
+from port_discovery import PortDiscovery
+
+# Folders that never contain user scripts; pruned by name before descending.
+_SKIP_DIRS = frozenset({"Library", "Temp", "Logs", "obj", "Obj", ".git"})
+
+# Listing cache: the Assets tree rarely changes between consecutive
+# resources/list calls, so reuse the last result until the scan root's
+# mtime moves or a writer bumps the generation counter. Deep edits that do
+# not touch the scan root's own mtime are caught by the generation bump.
+_list_cache = {"key": None, "mtime_ns": 0, "generation": -1, "items": None}
+_list_generation = 0
+
+
+def invalidate_resource_listing():
+    """Invalidate the cached listing; call after any tool that adds/removes scripts."""
+    global _list_generation
+    _list_generation += 1
+
+
+def _detect_project_root() -> Path | None:
+    """Locate the Unity project root.
+
+    Explicit UNITY_PROJECT_ROOT wins; otherwise use the project_path that the
+    bridge advertises in its newest heartbeat (Application.dataPath, i.e.
+    <project>/Assets).
+    """
+    env = os.environ.get("UNITY_PROJECT_ROOT")
+    if env:
+        return Path(env)
+    status = PortDiscovery._read_latest_status()
+    if status:
+        data_path = status.get("project_path")
+        if data_path:
+            p = Path(data_path)
+            return p.parent if p.name == "Assets" else p
+    return None
+
+
+def _iter_cs(root: str):
+    """Yield absolute paths of .cs files under root via an os.scandir stack.
+
+    DirEntry reuses the stat information from the directory read itself, so
+    unlike os.walk/Path.rglob this costs no extra stat syscall or Path
+    allocation per entry on large Assets trees.
+    """
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".cs"):
+                        yield entry.path
+                except OSError:
+                    continue
+
+
+# Below this size the mmap setup costs more than it saves; measured break-even
+# sits in the low hundreds of KiB.
+_MMAP_THRESHOLD = 256 * 1024
+
+# Machine-readable description of the script_apply_edits ops, served at
+# unity://spec/script-edits. Dumped (and thereby validated) once at import;
+# the sha never changes, so precompute it too.
+_SPEC_URI = "unity://spec/script-edits"
+_SPEC_DICT = {
+    "version": 1,
+    "ops": {
+        "prepend": {"fields": ["text"]},
+        "append": {"fields": ["text"]},
+        "anchor_insert": {"fields": ["anchor", "position", "text"], "position": ["before", "after"]},
+        "replace_range": {"fields": ["startLine", "endLine", "text"], "lines": "1-based inclusive"},
+        "regex_replace": {"fields": ["pattern", "replacement", "count"], "flags": "MULTILINE"},
+    },
+    "options": {"precondition_sha256": "sha256 of the current contents; mismatch rejects the batch"},
+}
+_SPEC_JSON = json.dumps(_SPEC_DICT, indent=2)
+_SPEC_SHA = hashlib.sha256(_SPEC_JSON.encode("utf-8")).hexdigest()
+
+# Read cache: editor loops fetch the same file's sha/text repeatedly before
+# and after edits. Entries are validated by (st_mtime_ns, st_size), so a
+# changed file can never serve stale content; hashing is deterministic, which
+# makes reuse safe. LRU-capped to bound resident text.
+_READ_CACHE_MAX = 128
+_read_cache: "OrderedDict[str, tuple[int, int, str, str]]" = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+
+def _read_and_hash(p: Path) -> tuple[bytes, str]:
+    """Read a file's bytes and sha256, memory-mapping large files.
+
+    For big scripts the kernel page cache feeds hashlib directly with no
+    Python-side read buffers; small files use a plain chunked read, and any
+    mmap failure (exotic filesystems, zero-length files) falls back to it too.
+    """
+    with open(p, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    h = hashlib.sha256(mm)
+                    raw = bytes(mm)
+                finally:
+                    mm.close()
+                return raw, h.hexdigest()
+            except (OSError, ValueError):
+                pass
+        h = hashlib.sha256()
+        chunks = []
+        while True:
+            b = f.read(1 << 20)
+            if not b:
+                break
+            h.update(b)
+            chunks.append(b)
+        return b"".join(chunks), h.hexdigest()
+
+
+# Prefix constants with their lengths precomputed once; _split_uri runs on
+# every resource read, so it should cost two startswith scans and a slice.
+_UNITY_PREFIX = "unity://path/"
+_UNITY_PREFIX_LEN = len(_UNITY_PREFIX)
+_FILE_PREFIX = "file://"
+_FILE_PREFIX_LEN = len(_FILE_PREFIX)
+
+
+def _split_uri(uri: str) -> str | None:
+    """Strip the unity://path/ or file:// scheme and normalize separators."""
+    if uri.startswith(_UNITY_PREFIX):
+        raw = uri[_UNITY_PREFIX_LEN:]
+    elif uri.startswith(_FILE_PREFIX):
+        raw = uri[_FILE_PREFIX_LEN:]
+    else:
+        raw = uri
+    return raw.replace("\\", "/")
+
+
+# realpath per directory, cached: symlinked directories are how a lexical
+# containment check gets escaped, and scripts cluster in few directories, so
+# one realpath walk per new directory covers all files beneath it.
+_dir_real_cache: Dict[str, str] = {}
+
+
+def _dir_real(d: str) -> str:
+    r = _dir_real_cache.get(d)
+    if r is None:
+        r = os.path.realpath(d)
+        if len(_dir_real_cache) > 256:
+            _dir_real_cache.clear()
+        _dir_real_cache[d] = r
+    return r
+
+
+def _resolve_safe_path_from_uri(uri: str, project_root: Path) -> Path | None:
+    """Resolve a resource URI to a path inside the project, or None if it escapes.
+
+    Containment is checked lexically with normpath (resolve() stats every
+    path component on POSIX, which is wasted I/O for the common case), then
+    the parent directory's cached realpath guards against symlinked
+    directories; a symlinked leaf falls back to a full resolve.
+    """
+    raw = _split_uri(uri)
+    if raw is None:
+        return None
+    root_str = str(project_root)
+    norm = os.path.normpath(os.path.join(root_str, raw))
+    if norm != root_str and not norm.startswith(root_str + os.sep):
+        return None
+    real_root = _dir_real(root_str)
+    real_parent = _dir_real(os.path.dirname(norm))
+    if real_parent != real_root and not real_parent.startswith(real_root + os.sep):
+        return None
+    if os.path.islink(norm):
+        p = Path(norm).resolve()
+        try:
+            p.relative_to(real_root)
+        except ValueError:
+            return None
+        return p
+    return Path(norm)
+
+
+def register_resource_tools(mcp: FastMCP):
+    """Registers the script resource tools with the MCP server."""
+
+    @mcp.tool()
+    def list_resources(
+        ctx: Context,
+        under: str = "Assets",
+    ) -> Dict[str, Any]:
+        """Lists C# script resources in the Unity project.
+
+        Args:
+            under: Project-relative folder to scan (default: "Assets").
+
+        Returns:
+            Dictionary with 'success' and 'data' containing resource URIs.
+        """
+        try:
+            project_root = _detect_project_root()
+            if project_root is None:
+                return {"success": False, "message": "Unity project root not found (set UNITY_PROJECT_ROOT or start the bridge)."}
+
+            # Contain the scan root the same way read_resource contains
+            # URIs: lexical normpath prefix check, then the cached realpath
+            # guard so a symlinked folder cannot point the walk off-project.
+            root_str = str(project_root)
+            norm = os.path.normpath(os.path.join(root_str, (under or "").replace("\\", "/")))
+            if norm != root_str and not norm.startswith(root_str + os.sep):
+                return {"success": False, "message": f"Folder not found: {under}"}
+            real_root = _dir_real(root_str)
+            real_scan = _dir_real(norm)
+            if real_scan != real_root and not real_scan.startswith(real_root + os.sep):
+                return {"success": False, "message": f"Folder not found: {under}"}
+            scan_root = Path(norm)
+            if not scan_root.is_dir():
+                return {"success": False, "message": f"Folder not found: {under}"}
+
+            key = str(scan_root)
+            st = scan_root.stat()
+            if (
+                _list_cache["items"] is not None
+                and _list_cache["key"] == key
+                and _list_cache["mtime_ns"] == st.st_mtime_ns
+                and _list_cache["generation"] == _list_generation
+            ):
+                return {"success": True, "data": {"resources": _list_cache["items"], "count": len(_list_cache["items"])}}
+
+            root_str = str(project_root)
+            resources = []
+            for path in _iter_cs(key):
+                rel = os.path.relpath(path, root_str).replace("\\", "/")
+                resources.append({
+                    "uri": f"unity://path/{rel}",
+                    "name": rel.rsplit("/", 1)[-1],
+                })
+            _list_cache.update(key=key, mtime_ns=st.st_mtime_ns, generation=_list_generation, items=resources)
+            return {"success": True, "data": {"resources": resources, "count": len(resources)}}
+        except Exception as e:
+            return {"success": False, "message": f"Python error listing resources: {str(e)}"}
+
+    @mcp.tool()
+    def read_resource(
+        ctx: Context,
+        uri: str,
+    ) -> Dict[str, Any]:
+        """Reads a C# script resource from the Unity project.
+
+        Args:
+            uri: Resource URI (unity://path/Assets/..., file://... or project-relative path).
+
+        Returns:
+            Dictionary with 'success' and 'data' containing text, sha256 and length.
+        """
+        try:
+            if uri == _SPEC_URI:
+                return {"success": True, "data": {"uri": uri, "text": _SPEC_JSON, "sha256": _SPEC_SHA, "lengthBytes": len(_SPEC_JSON)}}
+            project_root = _detect_project_root()
+            if project_root is None:
+                return {"success": False, "message": "Unity project root not found (set UNITY_PROJECT_ROOT or start the bridge)."}
+            p = _resolve_safe_path_from_uri(uri, project_root)
+            if p is None or not p.is_file():
+                return {"success": False, "message": f"Resource not found: {uri}"}
+
+            st = p.stat()
+            key = str(p)
+            with _read_cache_lock:
+                v = _read_cache.get(key)
+                if v is not None and v[0] == st.st_mtime_ns and v[1] == st.st_size:
+                    _read_cache.move_to_end(key)
+                    return {"success": True, "data": {"uri": uri, "text": v[3], "sha256": v[2], "lengthBytes": v[1]}}
+
+            raw, sha = _read_and_hash(p)
+            text = raw.decode("utf-8")
+            with _read_cache_lock:
+                _read_cache[key] = (st.st_mtime_ns, st.st_size, sha, text)
+                _read_cache.move_to_end(key)
+                while len(_read_cache) > _READ_CACHE_MAX:
+                    _read_cache.popitem(last=False)
+            return {"success": True, "data": {"uri": uri, "text": text, "sha256": sha, "lengthBytes": len(raw)}}
+        except Exception as e:
+            return {"success": False, "message": f"Python error reading resource: {str(e)}"}
@@ -1,6 +1,8 @@
+import asyncio
 import socket
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 import time
@@ -10,6 +12,21 @@ from typing import Dict, Any
 from config import config
 from port_discovery import PortDiscovery
 
+try:
+    # Optional accelerator: orjson parses bytes directly and is several times
+    # faster than the stdlib for the large responses the bridge returns.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+def _loads(data):
+    """Parse JSON from bytes or str, via orjson when available."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
 # Configure logging using settings from config
 logging.basicConfig(
     level=getattr(logging, config.log_level),
@@ -17,7 +34,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp-for-unity-server")
 
-@dataclass
+# Unity writes heartbeats every ~0.5 s, so a short monotonic TTL keeps the
+# status fresh while sparing a glob+stat of ~/.unity-mcp on every command.
+_STATUS_TTL = 0.25
+_status_cache = (0.0, None)
+
+def _read_status_file() -> dict | None:
+    """Return the newest unity-mcp-status payload, briefly cached."""
+    global _status_cache
+    now = time.monotonic()
+    ts, cached = _status_cache
+    if now - ts < _STATUS_TTL:
+        return cached
+    status = None
+    try:
+        status_files = sorted(Path.home().joinpath('.unity-mcp').glob('unity-mcp-status-*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+        if status_files:
+            latest = status_files[0]
+            with latest.open('r') as f:
+                status = json.load(f)
+    except Exception:
+        status = None
+    _status_cache = (now, status)
+    return status
+
+@dataclass(slots=True)
 class UnityConnection:
     """Manages the socket connection to the Unity Editor."""
     host: str = config.unity_host
@@ -29,17 +70,32 @@ class UnityConnection:
         if self.port is None:
             self.port = PortDiscovery.discover_unity_port()
 
+    @staticmethod
+    def _configure_socket(sock: socket.socket):
+        """Enable keep-alive and disable Nagle on the long-lived Unity socket.
+
+        The bridge exchanges small request/response frames, so TCP_NODELAY
+        avoids Nagle-induced latency; keep-alive matches what the C# listener
+        already sets on its side of the connection.
+        """
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.debug("Could not set socket options: %s", e)
+
     def connect(self) -> bool:
         """Establish a connection to the Unity Editor."""
         if self.sock:
             return True
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._configure_socket(self.sock)
             self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Unity at {self.host}:{self.port}")
+            logger.info("Connected to Unity at %s:%s", self.host, self.port)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Unity: {str(e)}")
+            logger.error("Failed to connect to Unity: %s", e)
             self.sock = None
             return False
 
@@ -49,34 +105,40 @@ class UnityConnection:
             try:
                 self.sock.close()
             except Exception as e:
-                logger.error(f"Error disconnecting from Unity: {str(e)}")
+                logger.error("Error disconnecting from Unity: %s", e)
             finally:
                 self.sock = None
 
     def receive_full_response(self, sock, buffer_size=config.buffer_size) -> bytes:
         """Receive a complete response from Unity, handling chunked data."""
-        chunks = []
+        buf = bytearray()
         sock.settimeout(config.connection_timeout)  # Use timeout from config
         try:
             while True:
                 chunk = sock.recv(buffer_size)
                 if not chunk:
-                    if not chunks:
+                    if not buf:
                         raise Exception("Connection closed before receiving data")
                     break
-                chunks.append(chunk)
-                
-                # Process the data received so far
-                data = b''.join(chunks)
+                buf += chunk
+
+                # Cheap completeness gate: every bridge response is a JSON
+                # object, so skip the full decode/parse below until the buffer
+                # at least ends with '}'. Without this, large responses pay an
+                # O(total) decode+parse per received chunk.
+                if not bytes(buf[-8:]).rstrip().endswith(b'}'):
+                    continue
+
+                data = bytes(buf)
                 decoded_data = data.decode('utf-8')
-                
+
                 # Check if we've received a complete response
                 try:
                     # Special case for ping-pong
                     if decoded_data.strip().startswith('{"status":"success","result":{"message":"pong"'):
                         logger.debug("Received ping response")
                         return data
-                    
+
                     # Handle escaped quotes in the content
                     if '"content":' in decoded_data:
                         # Find the content field and its value
@@ -89,52 +151,45 @@ class UnityConnection:
                             decoded_data = decoded_data[:content_start] + content + decoded_data[content_end:]
                     
                     # Validate JSON format
-                    json.loads(decoded_data)
+                    _loads(decoded_data)
                     
                     # If we get here, we have valid JSON
-                    logger.info(f"Received complete response ({len(data)} bytes)")
+                    logger.info("Received complete response (%d bytes)", len(data))
                     return data
                 except json.JSONDecodeError:
                     # We haven't received a complete valid JSON response yet
                     continue
                 except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
+                    logger.warning("Error processing response chunk: %s", e)
                     # Continue reading more chunks as this might not be the complete response
                     continue
         except socket.timeout:
             logger.warning("Socket timeout during receive")
             raise Exception("Timeout receiving Unity response")
         except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
+            logger.error("Error during receive: %s", e)
             raise
 
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a command with retry/backoff and port rediscovery. Pings only when requested."""
+    def send_command(self, command_type: str, params: Dict[str, Any] = None, *, max_attempts: int | None = None) -> Dict[str, Any]:
+        """Send a command with retry/backoff and port rediscovery. Pings only when requested.
+
+        max_attempts overrides the configured retry ladder; pass 0 for a
+        single attempt when a fast failure is preferable (pings, cheap reads).
+        """
         # Defensive guard: catch empty/placeholder invocations early
         if not command_type:
             raise ValueError("MCP call missing command_type")
         if params is None:
             # Return a fast, structured error that clients can display without hanging
             return {"success": False, "error": "MCP call received with no parameters (client placeholder?)"}
-        attempts = max(config.max_retries, 5)
+        attempts = max(config.max_retries, 5) if max_attempts is None else max_attempts
         base_backoff = max(0.5, config.retry_delay)
 
-        def read_status_file() -> dict | None:
-            try:
-                status_files = sorted(Path.home().joinpath('.unity-mcp').glob('unity-mcp-status-*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
-                if not status_files:
-                    return None
-                latest = status_files[0]
-                with latest.open('r') as f:
-                    return json.load(f)
-            except Exception:
-                return None
-
         last_short_timeout = None
 
         # Preflight: if Unity reports reloading, return a structured hint so clients can retry politely
         try:
-            status = read_status_file()
+            status = _read_status_file()
             if status and (status.get('reloading') or status.get('reason') == 'reloading'):
                 return {
                     "success": False,
@@ -152,18 +207,20 @@ class UnityConnection:
                 if not self.sock:
                     # During retries use short connect timeout
                     self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    self._configure_socket(self.sock)
                     self.sock.settimeout(1.0)
                     self.sock.connect((self.host, self.port))
                     # restore steady-state timeout for receive
                     self.sock.settimeout(config.connection_timeout)
-                    logger.info(f"Connected to Unity at {self.host}:{self.port}")
+                    logger.info("Connected to Unity at %s:%s", self.host, self.port)
 
                 # Build payload
                 if command_type == 'ping':
                     payload = b'ping'
                 else:
                     command = {"type": command_type, "params": params or {}}
-                    payload = json.dumps(command, ensure_ascii=False).encode('utf-8')
+                    # Compact separators: no need to pay for whitespace on the wire
+                    payload = json.dumps(command, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
                 # Send
                 self.sock.sendall(payload)
@@ -180,18 +237,18 @@ class UnityConnection:
 
                 # Parse
                 if command_type == 'ping':
-                    resp = json.loads(response_data.decode('utf-8'))
+                    resp = _loads(response_data)
                     if resp.get('status') == 'success' and resp.get('result', {}).get('message') == 'pong':
                         return {"message": "pong"}
                     raise Exception("Ping unsuccessful")
 
-                resp = json.loads(response_data.decode('utf-8'))
+                resp = _loads(response_data)
                 if resp.get('status') == 'error':
                     err = resp.get('error') or resp.get('message', 'Unknown Unity error')
                     raise Exception(err)
                 return resp.get('result', {})
             except Exception as e:
-                logger.warning(f"Unity communication attempt {attempt+1} failed: {e}")
+                logger.warning("Unity communication attempt %d failed: %s", attempt + 1, e)
                 try:
                     if self.sock:
                         self.sock.close()
@@ -202,14 +259,14 @@ class UnityConnection:
                 try:
                     new_port = PortDiscovery.discover_unity_port()
                     if new_port != self.port:
-                        logger.info(f"Unity port changed {self.port} -> {new_port}")
+                        logger.info("Unity port changed %s -> %s", self.port, new_port)
                     self.port = new_port
                 except Exception as de:
-                    logger.debug(f"Port discovery failed: {de}")
+                    logger.debug("Port discovery failed: %s", de)
 
                 if attempt < attempts:
                     # Heartbeat-aware, jittered backoff
-                    status = read_status_file()
+                    status = _read_status_file()
                     # Base exponential backoff
                     backoff = base_backoff * (2 ** attempt)
                     # Decorrelated jitter multiplier
@@ -240,18 +297,27 @@ class UnityConnection:
 # Global Unity connection
 _unity_connection = None
 
+# Verify the cached connection with a ping at most once per TTL; between
+# verifications callers get the handle back without a round-trip. Kubernetes
+# -style probe coalescing applied to the editor socket.
+_PING_TTL = 1.0
+_last_ping_ok = 0.0
+
 def get_unity_connection() -> UnityConnection:
     """Retrieve or establish a persistent Unity connection."""
-    global _unity_connection
+    global _unity_connection, _last_ping_ok
     if _unity_connection is not None:
+        if time.monotonic() - _last_ping_ok < _PING_TTL:
+            return _unity_connection
         try:
             # Try to ping with a short timeout to verify connection
-            result = _unity_connection.send_command("ping")
+            result = _unity_connection.send_command("ping", {}, max_attempts=0)
             # If we get here, the connection is still valid
+            _last_ping_ok = time.monotonic()
             logger.debug("Reusing existing Unity connection")
             return _unity_connection
         except Exception as e:
-            logger.warning(f"Existing connection failed: {str(e)}")
+            logger.warning("Existing connection failed: %s", e)
             try:
                 _unity_connection.disconnect()
             except:
@@ -267,11 +333,12 @@ def get_unity_connection() -> UnityConnection:
     
     try:
         # Verify the new connection works
-        _unity_connection.send_command("ping")
+        _unity_connection.send_command("ping", {}, max_attempts=0)
+        _last_ping_ok = time.monotonic()
         logger.info("Successfully established new Unity connection")
         return _unity_connection
     except Exception as e:
-        logger.error(f"Could not verify new connection: {str(e)}")
+        logger.error("Could not verify new connection: %s", e)
         try:
             _unity_connection.disconnect()
         except:
@@ -300,30 +367,59 @@ def send_command_with_retry(command_type: str, params: Dict[str, Any], *, max_re
     Uses config.reload_retry_ms and config.reload_max_retries by default. Preserves the
     structured failure if retries are exhausted.
     """
-    conn = get_unity_connection()
+    global _unity_connection
+    # Reuse the cached connection handle directly; send_command() already
+    # reconnects internally, so the verification ping inside
+    # get_unity_connection() is only worth paying when no handle exists yet.
+    conn = _unity_connection
+    if conn is None:
+        conn = get_unity_connection()
     if max_retries is None:
         max_retries = getattr(config, "reload_max_retries", 40)
     if retry_ms is None:
         retry_ms = getattr(config, "reload_retry_ms", 250)
 
-    response = conn.send_command(command_type, params)
-    retries = 0
-    while _is_reloading_response(response) and retries < max_retries:
-        delay_ms = int(response.get("retry_after_ms", retry_ms)) if isinstance(response, dict) else retry_ms
-        time.sleep(max(0.0, delay_ms / 1000.0))
-        retries += 1
+    try:
         response = conn.send_command(command_type, params)
-    return response
+        retries = 0
+        while _is_reloading_response(response) and retries < max_retries:
+            delay_ms = int(response.get("retry_after_ms", retry_ms)) if isinstance(response, dict) else retry_ms
+            time.sleep(max(0.0, delay_ms / 1000.0))
+            retries += 1
+            response = conn.send_command(command_type, params)
+        return response
+    except Exception:
+        # Drop the cached handle so the next call re-resolves and re-verifies.
+        if _unity_connection is conn:
+            _unity_connection = None
+        raise
+
+
+# Dedicated, pre-warmed pool for blocking Unity sends so they neither compete
+# with other default-executor work nor pay thread spin-up on first use. Small
+# on purpose: all traffic serializes over the single editor socket anyway.
+_send_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="unity-send")
+
+
+def send_command_once(command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a command with no retry ladder.
+
+    For idempotent reads and probes where surfacing a failure quickly is
+    better than persisting through it; reload waits still apply upstream.
+    """
+    conn = _unity_connection
+    if conn is None:
+        conn = get_unity_connection()
+    return conn.send_command(command_type, params, max_attempts=0)
 
 
 async def async_send_command_with_retry(command_type: str, params: Dict[str, Any], *, loop=None, max_retries: int | None = None, retry_ms: int | None = None) -> Dict[str, Any]:
     """Async wrapper that runs the blocking retry helper in a thread pool."""
     try:
-        import asyncio  # local import to avoid mandatory asyncio dependency for sync callers
         if loop is None:
             loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None,
+            _send_executor,
             lambda: send_command_with_retry(command_type, params, max_retries=max_retries, retry_ms=retry_ms),
         )
     except Exception as e: